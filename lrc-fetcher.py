@@ -1,11 +1,16 @@
 import os
 import sys
 import requests
+import requests.adapters
 import re
 import argparse
 from mutagen.flac import FLAC
 import concurrent.futures
 import threading
+import functools
+import hashlib
+import shelve
+import time
 import cutlet
 from hangul_romanize.rule import academic
 from hangul_romanize import Transliter
@@ -14,11 +19,94 @@ from hangul_romanize import Transliter
 LRCLIB_API_URL = "https://lrclib.net/api/get"
 LRCLIB_SEARCH_URL = "https://lrclib.net/api/search"
 MAX_WORKERS = 10
+SCAN_WORKERS = 16
+EMBED_WORKERS = 2
+CACHE_DIR = os.path.expanduser("~/.cache/lrc-fetcher")
+CACHE_TTL = 30 * 86400        # Found lyrics
+CACHE_MISS_TTL = 7 * 86400    # Not found, retried sooner
 
 # Initialize Cutlet globally
 KATSU = cutlet.Cutlet()
 KATSU.use_foreign_spelling = False
 
+# Initialize the Korean transliterator globally (stateless, safe to share across threads)
+KO_TRANSLITER = Transliter(academic)
+
+# Precompiled regexes
+RE_JAPANESE = re.compile(r'[ぁ-んァ-ン一-龯]')
+RE_KOREAN = re.compile(r'[\uAC00-\uD7A3]')
+RE_CJK = re.compile(r'[ぁ-んァ-ン一-龯\uAC00-\uD7A3]')
+LRC_TS_ANY_RE = re.compile(r'\[\d{2}:\d{2}(?:\.\d{2,3})?\]')
+LRC_TS_BYTES_RE = re.compile(rb'\[\d{2}:\d{2}(?:\.\d{2,3})?\]')
+# Matches one LRC line (sans leading whitespace) as timestamp+lyric, metadata tag, or plain text.
+# Groups are greedy so long whitespace runs can't cause backtracking; trailing whitespace is stripped in Python.
+LRC_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:(\[\d{2}:\d{2}(?:\.\d{2,3})?\])(.*)|(\[[a-zA-Z]+:.*)|(.*))$',
+    re.M)
+
+# One pooled HTTP session per worker thread (requests.Session isn't thread-safe)
+_thread_local = threading.local()
+
+def _session():
+    s = getattr(_thread_local, 's', None)
+    if s is None:
+        s = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        s.mount('https://', adapter)
+        _thread_local.s = s
+    return s
+
+# Persistent lrclib response cache, shared by all worker threads
+_cache = None
+_cache_lock = threading.Lock()
+
+def _get_cache():
+    """Lazily opens the on-disk cache. Returns None if it can't be opened."""
+    global _cache
+    if _cache is None:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            _cache = shelve.open(os.path.join(CACHE_DIR, "lrclib"))
+        except Exception as e:
+            print(f"⚠️  Warning: Could not open lyrics cache, continuing without it: {e}")
+            _cache = False
+    return _cache if _cache is not False else None
+
+def _cache_key(artist, title, duration):
+    return hashlib.sha1(f"{artist}|{title}|{duration}".encode()).hexdigest()
+
+def cache_get(artist, title, duration):
+    """Returns (hit, lyrics) from the on-disk cache, ignoring expired entries."""
+    with _cache_lock:
+        cache = _get_cache()
+        if cache is None:
+            return False, None
+        entry = cache.get(_cache_key(artist, title, duration))
+    if not entry:
+        return False, None
+    ttl = CACHE_TTL if entry['lyrics'] else CACHE_MISS_TTL
+    if time.time() - entry['time'] > ttl:
+        return False, None
+    return True, entry['lyrics']
+
+def cache_set(artist, title, duration, lyrics):
+    with _cache_lock:
+        cache = _get_cache()
+        if cache is not None:
+            cache[_cache_key(artist, title, duration)] = {'time': time.time(), 'lyrics': lyrics}
+
+def disable_cache():
+    global _cache
+    with _cache_lock:
+        _cache = False
+
+def close_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is not None and _cache is not False:
+            _cache.close()
+            _cache = None
+
 class ProgressTracker:
     def __init__(self):
         self.lrc_found = 0
@@ -42,6 +130,21 @@ class ProgressTracker:
     def increment_errors(self):
         with self.lock: self.errors += 1
 
+def iter_files(root, suffix):
+    """Recursively yields paths of files under root whose name ends with suffix (case-insensitive)."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffix) and entry.is_file():
+                        yield entry.path
+        except OSError:
+            # Match os.walk: silently skip directories we can't read
+            continue
+
 def get_flac_metadata(filepath):
     try:
         audio = FLAC(filepath)
@@ -58,57 +161,68 @@ def get_flac_metadata(filepath):
 
 def check_if_content_synced(content):
     """Checks if a string contains LRC timestamps."""
-    return bool(re.search(r'\[\d{2}:\d{2}(?:\.\d{2,3})?\]', content))
+    return bool(LRC_TS_ANY_RE.search(content))
 
 def check_if_file_synced(filepath):
     """Checks if an existing LRC file contains timestamps."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            # Read first 1000 chars to check for timestamps
-            content = f.read(1000)
-            return check_if_content_synced(content)
+        with open(filepath, 'rb') as f:
+            # Timestamps are ASCII, so scan raw bytes without decoding. 4000 bytes covers
+            # the first 1000 characters even when CJK tags take up to 4 bytes each
+            return bool(LRC_TS_BYTES_RE.search(f.read(4000)))
     except:
         return False
 
+def has_cjk(text):
+    """Checks if a string contains any Japanese or Korean characters."""
+    return bool(RE_CJK.search(text))
+
+@functools.lru_cache(maxsize=8192)
 def romanize_text(text):
     """Detects language (Japanese or Korean) and romanizes accordingly."""
-    RE_JAPANESE = re.compile(r'[ぁ-んァ-ン一-龯]')
-    RE_KOREAN = re.compile(r'[\uAC00-\uD7A3]')
-
+    if not has_cjk(text):
+        return text
     if RE_KOREAN.search(text):
-        transliter = Transliter(academic)
-        return transliter.translit(text)
+        return KO_TRANSLITER.translit(text)
     elif RE_JAPANESE.search(text):
         return KATSU.romaji(text)
     return text
 
+@functools.lru_cache(maxsize=256)
 def convert_lrc_content(lrc_content):
     """Parses LRC content and romanizes lyrics (both synced and unsynced)."""
     converted_lines = []
-    lrc_timestamp_regex = re.compile(r'(\[\d{2}:\d{2}(?:\.\d{2,3})?\])(.*)')
-    metadata_regex = re.compile(r'^\[[a-zA-Z]+:')
-
-    for line in lrc_content.strip().split('\n'):
-        line = line.strip()
-        if not line:
-            converted_lines.append("")
-            continue
 
-        timestamp_match = lrc_timestamp_regex.match(line)
-        if timestamp_match:
-            timestamp = timestamp_match.group(1)
-            lyric = timestamp_match.group(2).strip()
+    # One pass over the whole file; each match is a single line
+    for m in LRC_LINE_RE.finditer(lrc_content.strip()):
+        timestamp, lyric, metadata, text = m.groups()
+        if timestamp:
+            lyric = lyric.strip()
             if not lyric:
                 converted_lines.append(timestamp)
             else:
                 converted_lines.append(f"{timestamp} {romanize_text(lyric)}")
-        elif metadata_regex.match(line):
-            converted_lines.append(line)
+        elif metadata:
+            converted_lines.append(metadata.rstrip())
+        elif text:
+            converted_lines.append(romanize_text(text.rstrip()))
         else:
-            converted_lines.append(romanize_text(line))
+            converted_lines.append("")
 
     return "\n".join(converted_lines)
 
+def write_lrc_if_changed(lrc_path, lrc_content):
+    """Writes lyrics to an .lrc file unless it already holds identical content. Returns True if written."""
+    try:
+        with open(lrc_path, 'r', encoding='utf-8') as f:
+            if f.read() == lrc_content:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    with open(lrc_path, 'w', encoding='utf-8') as f:
+        f.write(lrc_content)
+    return True
+
 def embed_lyrics_into_flac(flac_path, lrc_content):
     """Embeds the provided lyrics string into the FLAC 'LYRICS' tag."""
     try:
@@ -120,12 +234,15 @@ def embed_lyrics_into_flac(flac_path, lrc_content):
         print(f"❌ Error embedding lyrics into {os.path.basename(flac_path)}: {e}")
         return False
 
-def fetch_lrc_from_lrclib(artist, title, duration):
-    try:
-        # Attempt 1: Exact Match
-        params = {'artist_name': artist, 'track_name': title}
-        if duration: params['duration'] = str(duration)
-        response = requests.get(LRCLIB_API_URL, params=params, timeout=10)
+def _query_lrclib(artist, title, duration):
+    """Queries lrclib (exact match, then fuzzy search). Raises on network/HTTP errors."""
+    # Attempt 1: Exact Match (the endpoint needs a duration to be useful, so go straight to search without one)
+    if duration:
+        params = {'artist_name': artist, 'track_name': title, 'duration': str(duration)}
+        response = _session().get(LRCLIB_API_URL, params=params, timeout=10)
+        # 404 just means no exact match; anything else (429, 5xx) must not end up cached as a miss
+        if response.status_code not in (200, 404):
+            response.raise_for_status()
 
         if response.status_code == 200:
             data = response.json()
@@ -136,40 +253,65 @@ def fetch_lrc_from_lrclib(artist, title, duration):
                 print(f"    -> Found exact match (plain) for '{title}'.")
                 return data["plainLyrics"]
 
-        # Attempt 2: Fuzzy Search
         print(f"    -> Exact match failed or incomplete. Trying fuzzy search...")
-        search_query = f"{artist} {title}"
-        response = requests.get(LRCLIB_SEARCH_URL, params={"q": search_query}, timeout=10)
-
-        if response.status_code == 200:
-            results = response.json()
-            if not results: return None
-
-            valid_matches = []
-            if duration:
-                for r in results:
-                    diff = abs(r.get("duration", 0) - duration)
-                    if diff <= 3:
-                        valid_matches.append((r, diff))
-
-            if valid_matches:
-                valid_matches.sort(key=lambda x: (1 if x[0].get("syncedLyrics") else 0, -x[1]), reverse=True)
-                best_match = valid_matches[0][0]
-            else:
-                best_match = results[0]
+    else:
+        print(f"    -> No duration available. Trying fuzzy search...")
+
+    # Attempt 2: Fuzzy Search
+    search_query = f"{artist} {title}"
+    response = _session().get(LRCLIB_SEARCH_URL, params={"q": search_query}, timeout=10)
+
+    response.raise_for_status()
+    results = response.json()
+    if not results: return None
+
+    # A synced top hit with the exact duration would win the ranking below anyway
+    top = results[0]
+    if top.get("syncedLyrics") and (not duration or top.get("duration") == duration):
+        print(f"    -> Found synced lyrics via fuzzy search.")
+        return top["syncedLyrics"]
+
+    valid_matches = []
+    if duration:
+        for r in results:
+            diff = abs(r.get("duration", 0) - duration)
+            if diff <= 3:
+                valid_matches.append((r, diff))
+
+    if valid_matches:
+        valid_matches.sort(key=lambda x: (1 if x[0].get("syncedLyrics") else 0, -x[1]), reverse=True)
+        best_match = valid_matches[0][0]
+    else:
+        best_match = results[0]
+
+    if best_match.get("syncedLyrics"):
+        print(f"    -> Found synced lyrics via fuzzy search.")
+        return best_match["syncedLyrics"]
+    elif best_match.get("plainLyrics"):
+        print(f"    -> Found plain lyrics via fuzzy search.")
+        return best_match["plainLyrics"]
+    return None
 
-            if best_match.get("syncedLyrics"):
-                print(f"    -> Found synced lyrics via fuzzy search.")
-                return best_match["syncedLyrics"]
-            elif best_match.get("plainLyrics"):
-                print(f"    -> Found plain lyrics via fuzzy search.")
-                return best_match["plainLyrics"]
+def fetch_lrc_from_lrclib(artist, title, duration, require_synced=False):
+    hit, lyrics = cache_get(artist, title, duration)
+    # A cached plain-only result can't satisfy an upgrade, so ask lrclib again
+    if hit and require_synced and lyrics and not check_if_content_synced(lyrics):
+        hit = False
+    if hit:
+        print(f"    -> Using cached lookup for '{title}'.")
+        return lyrics
 
+    try:
+        lyrics = _query_lrclib(artist, title, duration)
     except Exception as e:
+        # Don't cache failures as misses, so they are retried next run
         print(f"❌ Error fetching '{artist} - {title}': {e}")
-    return None
+        return None
+
+    cache_set(artist, title, duration, lyrics)
+    return lyrics
 
-def process_song(song_info, tracker, do_romanize, embed_lyrics):
+def process_song(song_info, tracker, do_romanize, embed_lyrics, embed_executor=None, embed_slots=None):
     flac_path = song_info['flac_path']
     lrc_path = song_info['lrc_path']
     artist = song_info['artist']
@@ -179,7 +321,7 @@ def process_song(song_info, tracker, do_romanize, embed_lyrics):
     filename = os.path.basename(flac_path)
 
     print(f"🔎 Processing: {filename}")
-    lrc_content = fetch_lrc_from_lrclib(artist, title, duration)
+    lrc_content = fetch_lrc_from_lrclib(artist, title, duration, require_synced=is_upgrade_attempt)
 
     if lrc_content:
         # Check if we are upgrading: Don't overwrite unsynced with unsynced
@@ -199,22 +341,42 @@ def process_song(song_info, tracker, do_romanize, embed_lyrics):
                     tracker.increment_romanized()
 
             # 2. Save to .lrc file
-            with open(lrc_path, 'w', encoding='utf-8') as f:
-                f.write(lrc_content)
-
-            if is_upgrade_attempt:
+            if not write_lrc_if_changed(lrc_path, lrc_content):
+                print(f"    -> Existing .lrc file is already up to date.")
+            elif is_upgrade_attempt:
                 print(f"    -> 🆙 Upgraded to synced lyrics!")
                 tracker.increment_upgraded()
             else:
                 print(f"    -> Saved .lrc file.")
                 tracker.increment_found()
 
-            # 3. Embed into FLAC if requested
+            # 3. Embed into FLAC if requested (handed off so this worker can fetch the next song)
             if embed_lyrics:
-                success = embed_lyrics_into_flac(flac_path, lrc_content)
-                if success:
-                    print(f"    -> Embedded lyrics into FLAC.")
-                    tracker.increment_embedded()
+                def on_embedded(success):
+                    if success:
+                        print(f"    -> Embedded lyrics into {filename}.")
+                        tracker.increment_embedded()
+
+                if embed_executor:
+                    def on_done(future):
+                        try:
+                            on_embedded(future.result())
+                        except Exception as exc:
+                            print(f"❌ Error embedding lyrics into {filename}: {exc}")
+                            tracker.increment_errors()
+                        finally:
+                            embed_slots.release()
+
+                    # Blocks while the embed queue is full, so a slow disk throttles fetching
+                    embed_slots.acquire()
+                    try:
+                        future = embed_executor.submit(embed_lyrics_into_flac, flac_path, lrc_content)
+                    except Exception:
+                        embed_slots.release()
+                        raise
+                    future.add_done_callback(on_done)
+                else:
+                    on_embedded(embed_lyrics_into_flac(flac_path, lrc_content))
 
         except IOError as e:
             print(f"❌ Error saving file for {filename}: {e}")
@@ -226,11 +388,7 @@ def process_song(song_info, tracker, do_romanize, embed_lyrics):
 def process_existing_lrcs(music_dir, embed_lyrics):
     """Scans for existing .lrc files, romanizes them, and/or embeds them."""
     print("\n--- Processing Existing LRC Files ---")
-    lrc_files_found = []
-    for root, _, files in os.walk(music_dir):
-        for filename in files:
-            if filename.lower().endswith('.lrc'):
-                lrc_files_found.append(os.path.join(root, filename))
+    lrc_files_found = list(iter_files(music_dir, '.lrc'))
 
     if not lrc_files_found:
         print("No .lrc files found.")
@@ -248,12 +406,15 @@ def process_existing_lrcs(music_dir, embed_lyrics):
                 content = f.read()
 
             # Romanize logic
-            if re.search(r'[ぁ-んァ-ン一-龯\uAC00-\uD7A3]', content):
-                print(f"-> Romanizing: {os.path.basename(lrc_path)}")
-                content = convert_lrc_content(content)
-                with open(lrc_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                converted_count += 1
+            if has_cjk(content):
+                new_content = convert_lrc_content(content)
+                # Skip the rewrite when romanization didn't change anything
+                if new_content != content:
+                    print(f"-> Romanizing: {os.path.basename(lrc_path)}")
+                    with open(lrc_path, 'w', encoding='utf-8') as f:
+                        f.write(new_content)
+                    content = new_content
+                    converted_count += 1
 
             # Embed logic
             if embed_lyrics and os.path.exists(flac_path):
@@ -269,7 +430,47 @@ def process_existing_lrcs(music_dir, embed_lyrics):
     print(f"Embedded into FLAC: {embedded_count}")
     print("------------------------------")
 
-def process_music_library(music_dir, do_romanize, embed_lyrics, scan_unsynced):
+def scan_flac(flac_path, scan_unsynced, lrc_files):
+    """Phase 1 check for a single FLAC. Returns (status, song_info)."""
+    filename = os.path.basename(flac_path)
+    lrc_path = os.path.splitext(flac_path)[0] + '.lrc'
+
+    # The set only has exact spellings; on case-insensitive filesystems (Windows, macOS)
+    # a 'Song.LRC' still counts, so confirm misses with the filesystem
+    lrc_exists = lrc_path in lrc_files or os.path.exists(lrc_path)
+    upgrade_attempt = False
+
+    if scan_unsynced:
+        # Upgrade Mode: Only care if LRC exists and is unsynced
+        if lrc_exists:
+            if check_if_file_synced(lrc_path):
+                return 'skipped', None # "Skipped (Already Synced)"
+            # Found unsynced file -> Mark for upgrade
+            upgrade_attempt = True
+        else:
+            # LRC doesn't exist -> Skip (Don't fetch missing in this mode)
+            return 'ignored', None
+    else:
+        # Default Mode: Only care if LRC is missing
+        if lrc_exists:
+            return 'skipped', None
+        # Else: LRC missing -> Fetch new
+
+    # If we reached here, we are processing this song
+    if upgrade_attempt:
+        print(f"⚠️  Found unsynced lyrics for '{filename}'. Will try to upgrade.")
+
+    artist, title, duration = get_flac_metadata(flac_path)
+    # Songs without a duration still go through; the lookup falls back to search only
+    if not artist or not title:
+        return 'ignored', None
+    return 'queued', {
+        'flac_path': flac_path, 'lrc_path': lrc_path,
+        'artist': artist, 'title': title, 'duration': duration,
+        'upgrade_attempt': upgrade_attempt
+    }
+
+def process_music_library(music_dir, do_romanize, embed_lyrics, scan_unsynced, max_workers=MAX_WORKERS):
     if not os.path.isdir(music_dir):
         print(f"❌ Error: Directory not found at '{music_dir}'")
         return
@@ -278,68 +479,64 @@ def process_music_library(music_dir, do_romanize, embed_lyrics, scan_unsynced):
     print(f"--- Phase 1: {mode_label} ---")
 
     songs_to_process = []
-    total_files = 0
     lrc_skipped = 0
     lrc_upgrades_needed = 0
 
-    for root, _, files in os.walk(music_dir):
-        for filename in files:
-            if filename.lower().endswith('.flac'):
-                total_files += 1
-                flac_path = os.path.join(root, filename)
-                lrc_path = os.path.splitext(flac_path)[0] + '.lrc'
-
-                lrc_exists = os.path.exists(lrc_path)
-                upgrade_attempt = False
-
-                if scan_unsynced:
-                    # Upgrade Mode: Only care if LRC exists and is unsynced
-                    if lrc_exists:
-                        if check_if_file_synced(lrc_path):
-                            lrc_skipped += 1 # "Skipped (Already Synced)"
-                            continue
-                        else:
-                            # Found unsynced file -> Mark for upgrade
-                            upgrade_attempt = True
-                            lrc_upgrades_needed += 1
-                    else:
-                        # LRC doesn't exist -> Skip (Don't fetch missing in this mode)
-                        continue
-                else:
-                    # Default Mode: Only care if LRC is missing
-                    if lrc_exists:
-                        lrc_skipped += 1
-                        continue
-                    # Else: LRC missing -> Fetch new
-
-                # If we reached here, we are processing this song
-                if upgrade_attempt:
-                     print(f"⚠️  Found unsynced lyrics for '{filename}'. Will try to upgrade.")
-
-                artist, title, duration = get_flac_metadata(flac_path)
-                if all([artist, title, duration]):
-                    songs_to_process.append({
-                        'flac_path': flac_path, 'lrc_path': lrc_path,
-                        'artist': artist, 'title': title, 'duration': duration,
-                        'upgrade_attempt': upgrade_attempt
-                    })
+    # Collect existing .lrc files in the same pass to avoid a stat per song
+    flac_files = []
+    lrc_files = set()
+    for path in iter_files(music_dir, ('.flac', '.lrc')):
+        if path.lower().endswith('.flac'):
+            flac_files.append(path)
+        else:
+            lrc_files.add(path)
+    total_files = len(flac_files)
+
+    # LRC checks and FLAC header parsing are independent per file, so overlap the I/O
+    with concurrent.futures.ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        scan_results = list(executor.map(lambda path: scan_flac(path, scan_unsynced, lrc_files), flac_files))
+
+    for status, song_info in scan_results:
+        if status == 'skipped':
+            lrc_skipped += 1
+        elif song_info:
+            if song_info['upgrade_attempt']:
+                lrc_upgrades_needed += 1
+            songs_to_process.append(song_info)
+
+    # Group by artist so consecutive lookups hit lrclib with related queries over warm connections
+    songs_to_process.sort(key=lambda song: (song['artist'].lower(), song['title'].lower()))
 
     print(f"Scan complete. Found {len(songs_to_process)} songs to process.\n")
     if not songs_to_process:
         print("✨ No songs found matching current mode criteria.")
         return
 
-    print(f"--- Phase 2: Fetching & Processing ({MAX_WORKERS} threads) ---")
+    print(f"--- Phase 2: Fetching & Processing ({max_workers} threads) ---")
     tracker = ProgressTracker()
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_to_song = {executor.submit(process_song, song, tracker, do_romanize, embed_lyrics): song for song in songs_to_process}
-        for future in concurrent.futures.as_completed(future_to_song):
-            try:
-                future.result()
-            except Exception as exc:
-                print(f"❌ Exception: {exc}")
-                tracker.increment_errors()
+    # FLAC.save() rewrites the whole file, so tagging runs on its own small pool
+    # (shut down last, after every fetch has queued its embed)
+    embed_slots = threading.BoundedSemaphore(EMBED_WORKERS * 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=EMBED_WORKERS, thread_name_prefix='embed') as embed_executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            def drain(futures):
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        print(f"❌ Exception: {exc}")
+                        tracker.increment_errors()
+
+            # Keep only a bounded number of songs in flight so finished results can be freed
+            max_pending = max_workers * 4
+            pending = set()
+            for song in songs_to_process:
+                if len(pending) >= max_pending:
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    drain(done)
+                pending.add(executor.submit(process_song, song, tracker, do_romanize, embed_lyrics, embed_executor, embed_slots))
+            drain(concurrent.futures.as_completed(pending))
 
     print("\n--- Summary ---")
     print(f"Total FLAC files: {total_files}")
@@ -358,6 +555,16 @@ def process_music_library(music_dir, do_romanize, embed_lyrics, scan_unsynced):
         print(f"Not found: {tracker.lrc_not_found}")
     print("---------------")
 
+def positive_int(value):
+    """argparse type for options that need a count of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Fetch, romanize, and embed lyrics for FLAC files.")
     parser.add_argument("music_dir", help="The root directory of your music library.")
@@ -365,6 +572,8 @@ if __name__ == "__main__":
     # Flags
     parser.add_argument("--romanize", action="store_true", help="Convert Japanese (Romaji) and Korean (Romanized) lyrics.")
     parser.add_argument("--embed", action="store_true", help="Embed the lyrics (text/lrc) into the FLAC file metadata.")
+    parser.add_argument("--no-cache", action="store_true", help=f"Ignore the local lrclib lookup cache ({CACHE_DIR}).")
+    parser.add_argument("--workers", type=positive_int, default=MAX_WORKERS, help=f"Number of concurrent lyric downloads (default: {MAX_WORKERS}).")
 
     # Modes (Mutually exclusive logical flows)
     group = parser.add_argument_group('modes')
@@ -373,7 +582,13 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    if args.process_existing:
-        process_existing_lrcs(args.music_dir, args.embed)
-    else:
-        process_music_library(args.music_dir, args.romanize, args.embed, args.scan_unsynced)
+    if args.no_cache:
+        disable_cache()
+
+    try:
+        if args.process_existing:
+            process_existing_lrcs(args.music_dir, args.embed)
+        else:
+            process_music_library(args.music_dir, args.romanize, args.embed, args.scan_unsynced, args.workers)
+    finally:
+        close_cache()